@@ -1,7 +1,8 @@
 """Configuration loading and processing."""
 
-from pathlib import Path
-from typing import IO, Optional, Sequence, Union
+import os
+import threading
+from typing import IO, Any, Optional, Sequence, Union
 
 
 from pyamlo.override import process_overrides
@@ -9,9 +10,66 @@ from pyamlo.resolve import Resolver
 from pyamlo.sources import get_sources, merge_all_sources
 from pyamlo.security import SecurityPolicy
 
+_ATOMIC = (int, float, bool, type(None))
+
+
+def _needs_resolution(node: Any) -> bool:
+    """Check whether a parsed tree contains anything the resolver acts on.
+
+    Strings without a '$' marker and plain scalars resolve to themselves;
+    any tagged object (CallSpec, includes, specs) or unknown type is
+    conservatively reported as needing the full resolver pass.
+    """
+    if isinstance(node, str):
+        return "$" in node
+    if type(node) is dict:
+        return any(_needs_resolution(v) for v in node.values())
+    if type(node) is list:
+        return any(_needs_resolution(v) for v in node)
+    return not isinstance(node, _ATOMIC)
+
+
+_pool = threading.local()
+
+
+def _pooled_resolver(security_policy: SecurityPolicy) -> Resolver:
+    """Reuse one Resolver per thread so batch loads keep dict capacity.
+
+    A fresh instance is created when the policy differs or the pooled one
+    is already mid-resolve (re-entrant load_config from a constructed
+    object).
+    """
+    resolver = getattr(_pool, "resolver", None)
+    if (
+        resolver is None
+        or resolver.security_policy is not security_policy
+        or getattr(_pool, "busy", False)
+    ):
+        return Resolver(security_policy=security_policy)
+    resolver.reset()
+    return resolver
+
+
+def _resolve_pooled(config: dict, security_policy: SecurityPolicy) -> dict:
+    resolver = _pooled_resolver(security_policy)
+    _pool.resolver = resolver
+    _pool.busy = True
+    try:
+        return resolver.resolve(config)
+    finally:
+        _pool.busy = False
+        # Release references to the resolved tree between loads.
+        resolver.reset()
+
 
 def load_config(
-    source: Union[str, Path, IO[str], dict, Sequence[Union[str, Path, IO[str], dict]]],
+    source: Union[
+        str,
+        os.PathLike,
+        IO[str],
+        dict,
+        Sequence[Union[str, os.PathLike, IO[str], dict]],
+    ],
     overrides: Optional[list[str]] = None,
     use_cli: bool = False,
     security_policy: SecurityPolicy = SecurityPolicy(restrictive=False),
@@ -22,7 +80,13 @@ def load_config(
     sources = get_sources(source)
     config = merge_all_sources(sources, security_policy)
     config = process_overrides(config, overrides, use_cli)
-    return Resolver(security_policy=security_policy).resolve(config)
+    # Dict sources are only shallow-copied, so they always go through the
+    # resolver to keep the returned tree independent of the caller's input.
+    if not any(isinstance(src, dict) for src in sources) and not _needs_resolution(
+        config
+    ):
+        return config
+    return _resolve_pooled(config, security_policy)
 
 
 class Loader:
@@ -36,7 +100,11 @@ class Loader:
     def load(
         self,
         source: Union[
-            str, Path, IO[str], dict, Sequence[Union[str, Path, IO[str], dict]]
+            str,
+            os.PathLike,
+            IO[str],
+            dict,
+            Sequence[Union[str, os.PathLike, IO[str], dict]],
         ],
         overrides: Optional[list[str]] = None,
     ):
@@ -1,3 +1,4 @@
+import functools
 import re
 from typing import Any
 
@@ -35,6 +36,14 @@ _OPERATORS = {
 }
 _KEYWORDS = {"and", "or", "not", "if", "else"}
 
+_MISSING = object()
+# Folded results for variable-free expressions like '${30 * 60}'. Only
+# immutable values are kept so callers never share a mutable object; bounded
+# like the other parse caches, evicting oldest-first.
+_CONST_RESULTS: dict[str, Any] = {}
+_CONST_RESULTS_MAX = 1024
+_IMMUTABLE_RESULTS = (int, float, complex, str, bytes, type(None))
+
 
 def is_expression(expression: str) -> bool:
     return any(op in expression for op in _OPERATORS) or any(
@@ -42,6 +51,11 @@ def is_expression(expression: str) -> bool:
     )
 
 
+@functools.lru_cache(maxsize=1024)
+def _compile_expression(expression: str):
+    return compile(expression, "<pyamlo-expression>", "eval")
+
+
 def _extract_variables(expression: str) -> list[str]:
     no_strings = re.sub(r'"[^"]*"|\'[^\']*\'', "", expression)
     variables = re.findall(r"\b[a-zA-Z_][a-zA-Z0-9_.]*\b", no_strings)
@@ -57,10 +71,20 @@ class ExpressionEvaluator:
         if is_expression(expression):
             self.security_policy.check_expression(expression)
         safe_expression, namespace = self._get_safe_expr_with_ns(expression)
+        if not namespace:
+            cached = _CONST_RESULTS.get(safe_expression, _MISSING)
+            if cached is not _MISSING:
+                return cached
         try:
-            return eval(safe_expression, {"__builtins__": {}}, namespace)
+            code = _compile_expression(safe_expression)
+            result = eval(code, {"__builtins__": {}}, namespace)
         except Exception as e:
             raise ExpressionError(f"Invalid expression '{expression}': {e}")
+        if not namespace and isinstance(result, _IMMUTABLE_RESULTS):
+            if len(_CONST_RESULTS) >= _CONST_RESULTS_MAX:
+                del _CONST_RESULTS[next(iter(_CONST_RESULTS))]
+            _CONST_RESULTS[safe_expression] = result
+        return result
 
     def _get_safe_expr_with_ns(self, expression):
         variables_found = _extract_variables(expression)
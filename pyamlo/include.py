@@ -1,6 +1,7 @@
+import copy
 import os
+from io import StringIO
 from typing import Any
-import yaml
 
 from pyamlo.merge import deep_merge
 from pyamlo.security import SecurityPolicy
@@ -11,6 +12,31 @@ class IncludeError(Exception):
     """Problems during include! processing."""
 
 
+# One entry per file: realpath -> (mtime_ns, parsed tree). Keying on the
+# path alone means an edited file replaces its stale tree instead of
+# stranding it for the process lifetime.
+_parse_cache: dict[str, tuple[int, Any]] = {}
+
+_IMMUTABLE_LEAVES = frozenset({str, int, float, bool, type(None)})
+
+
+def _clone_tree(node: Any) -> Any:
+    """Clone a parsed tree, sharing immutable leaves.
+
+    Plain dicts/lists are rebuilt directly, which is considerably faster
+    than copy.deepcopy; tag spec objects and anything unusual fall back to
+    deepcopy so mutation during merging never leaks into the cache.
+    """
+    t = type(node)
+    if t in _IMMUTABLE_LEAVES:
+        return node
+    if t is dict:
+        return {key: _clone_tree(val) for key, val in node.items()}
+    if t is list:
+        return [_clone_tree(val) for val in node]
+    return copy.deepcopy(node)
+
+
 def set_base_paths(data: Any, base_path: str) -> None:
     """Recursively set base paths on IncludeSpec and IncludeAsSpec objects."""
     if isinstance(data, (IncludeSpec, IncludeFromSpec)):
@@ -25,8 +51,27 @@ def set_base_paths(data: Any, base_path: str) -> None:
 
 def load_raw(path: str) -> dict[str, Any]:
     try:
+        key = os.path.realpath(path)
+        mtime = os.stat(path).st_mtime_ns
+        cached = _parse_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return _clone_tree(cached[1])
         with open(path) as f:
-            return yaml.load(f, Loader=ConfigLoader)
+            stream = StringIO(f.read())
+        # Keep the include path in YAML error marks.
+        stream.name = path
+        loader = ConfigLoader(stream)
+        try:
+            raw = loader.get_single_data()
+        finally:
+            loader.dispose()
+        if loader._used_env:
+            _parse_cache.pop(key, None)
+        else:
+            # Callers mutate the returned tree (include pops, base paths,
+            # merging), so the cache keeps its own clone.
+            _parse_cache[key] = (mtime, _clone_tree(raw))
+        return raw
     except FileNotFoundError as e:
         raise IncludeError(f"Include file not found: '{path}'") from e
     except Exception as e:
@@ -1,6 +1,5 @@
 """CLI utilities for PYAMLO configuration overrides."""
 
-from io import StringIO
 import sys
 from typing import Any, Dict, Optional
 from functools import reduce
@@ -32,20 +31,18 @@ def parse_cli_overrides(overrides: list[str]) -> Dict[str, Any]:
     result: Dict[str, Any] = {}
 
     for override in overrides:
-        if "=" not in override:
+        key, sep, value = override.partition("=")
+        if not sep:
             raise OverrideError(
                 f"Invalid override format: {override}. Expected key=value"
             )
-
-        key, value = override.split("=", 1)
         if not key.startswith("pyamlo."):
             continue
 
         parts = key[7:].split(".")
 
         try:
-            loader = ConfigLoader(StringIO(value))
-            parsed_value = loader.get_single_data()
+            parsed_value = yaml.load(value, Loader=ConfigLoader)
         except Exception:
             try:
                 parsed_value = yaml.safe_load(value)
@@ -1,7 +1,8 @@
 import importlib
 import os
 import re
-from functools import singledispatchmethod
+import sys
+from functools import lru_cache, singledispatchmethod
 from typing import Any
 
 from pyamlo.expressions import ExpressionEvaluator, is_expression
@@ -15,17 +16,67 @@ from pyamlo.tags import (
     ResolutionError,
 )
 
+_MISSING = object()
+# Leaf types that always resolve to themselves; checked before dispatching
+# into singledispatch to keep the common case a single set probe.
+_ATOMIC = frozenset({int, float, bool, type(None)})
+
+
+@lru_cache(maxsize=2048)
+def _split_path(path: str) -> tuple[str, ...]:
+    """Split a dotted path once, interning segments for fast dict probes."""
+    return tuple(sys.intern(part) for part in path.split("."))
+
+
+@lru_cache(maxsize=512)
+def _tokenize_path_template(template: str) -> tuple[tuple[bool, str], ...]:
+    """Scan a '$var'-style path template once into (is_var, text) segments."""
+    tokens: list[tuple[bool, str]] = []
+    i = 0
+    lit_start = 0
+    n = len(template)
+    while i < n:
+        nxt = template[i + 1] if i + 1 < n else ""
+        if template[i] == "$" and (nxt == "_" or (nxt.isascii() and nxt.isalpha())):
+            if lit_start < i:
+                tokens.append((False, template[lit_start:i]))
+            j = i + 1
+            while j < n and (
+                template[j] == "_" or (template[j].isascii() and template[j].isalnum())
+            ):
+                j += 1
+            tokens.append((True, template[i + 1 : j]))
+            i = lit_start = j
+        else:
+            i += 1
+    if lit_start < n:
+        tokens.append((False, template[lit_start:]))
+    return tuple(tokens)
+
 
 class Resolver:
     VAR_RE = re.compile(r"\$\{([^}]+)\}")
 
     def __init__(self, security_policy=SecurityPolicy(restrictive=False)) -> None:
         self.ctx: dict[str, Any] = {}
+        # Per-run cache for interpolated strings; a Resolver lives for one
+        # load, so identical references resolve once per pass. The cache is
+        # abandoned if a context path ever gets re-registered (duplicate
+        # paths from list elements), since references may then legitimately
+        # resolve differently over time.
+        self._memo: dict[str, Any] = {}
+        self._memo_enabled = True
         self._expression_evaluator = ExpressionEvaluator(
             self._get, security_policy=security_policy
         )
         self.security_policy = security_policy
 
+    def reset(self) -> None:
+        """Clear per-run state while keeping the allocated dict capacity."""
+        self.ctx.clear()
+        self._memo.clear()
+        self._memo_enabled = True
+
     @singledispatchmethod
     def resolve(self, node: Any, path: str = "") -> Any:
         return node
@@ -43,7 +94,14 @@ class Resolver:
         self.security_policy.check_include(fn)
         raw = load_raw(fn)
         merged = process_includes(raw, fn, security_policy=self.security_policy)
-        return self.resolve(merged)
+        # Resolving the included tree registers its nodes from the root path,
+        # clobbering entries the outer document already owns (notably the root
+        # itself, which parent-linking relies on). Restore the pre-existing
+        # entries afterwards; aliases newly added by the include are kept.
+        saved = dict(self.ctx)
+        resolved = self.resolve(merged)
+        self.ctx.update(saved)
+        return resolved
 
     @resolve.register
     def _(self, node: IncludeSpec, path: str = "") -> dict:
@@ -72,74 +130,142 @@ class Resolver:
         else:
             fn = self._resolve_direct_callable(node.path)
         
-        args = [self.resolve(a, path) for a in node.args]
-        kwargs = {k: self.resolve(v, path) for k, v in node.kwargs.items()}
+        args = [self.resolve(a, path) for a in node.args] if node.args else []
+        kwargs = (
+            {k: self.resolve(v, path) for k, v in node.kwargs.items()}
+            if node.kwargs
+            else {}
+        )
         inst = _apply_call(fn, args, kwargs)
+        if path in self.ctx:
+            self._drop_memo()
         self.ctx[path] = inst
         return inst
 
     @resolve.register
     def _(self, node: dict, path: str = "") -> dict[str, Any]:
         out: dict[str, Any] = {}
-        self.ctx[path] = out
-        for key, val in node.items():
-            child = f"{path}.{key}" if path else key
-            resolved_val = self.resolve(val, child)
-            
-            # Special handling for _ wildcard with IncludeFromSpec
-            if key == "_" and isinstance(val, IncludeFromSpec):
-                # Merge the resolved content directly into out instead of setting out[key]
-                if isinstance(resolved_val, dict):
-                    out.update(resolved_val)
-                    # Update context for all merged keys
-                    for merged_key, merged_val in resolved_val.items():
-                        merged_child = f"{path}.{merged_key}" if path else merged_key
-                        self.ctx[merged_child] = merged_val
-                    # Don't add the _ key itself to out or context
-                    # Skip the parent context updating for _ wildcard
-                    continue
-                else:
-                    # If resolved value is not a dict, treat it normally
-                    out[key] = resolved_val
-                    self.ctx[child] = resolved_val
-            else:
-                out[key] = resolved_val
-                self.ctx[child] = resolved_val
-            
-            # Ensure all parent paths are updated with resolved children
-            if "." in child:
-                parts = child.split(".")
-                for i in range(len(parts) - 1):  # Don't include the child itself
-                    parent_path = ".".join(parts[:i+1])
-                    if parent_path in self.ctx and isinstance(self.ctx[parent_path], dict):
-                        # Navigate and update the nested structure
-                        target = self.ctx[parent_path]
-                        remaining_parts = parts[i+1:]
-                        for part in remaining_parts[:-1]:
-                            if part not in target:
-                                target[part] = {}
-                            target = target[part]
-                        if remaining_parts:
-                            target[remaining_parts[-1]] = resolved_val
-                    
+        self._enter_dict(out, path)
+        self._resolve_containers(iter(node.items()), out, path)
         return out
 
     @resolve.register
     def _(self, node: list, path: str = "") -> list[Any]:
-        return [self.resolve(x, path) for x in node]
+        out: list[Any] = []
+        self._resolve_containers(iter(node), out, path)
+        return out
+
+    def _drop_memo(self) -> None:
+        self._memo.clear()
+        self._memo_enabled = False
+
+    def _enter_dict(self, out: dict[str, Any], path: str) -> None:
+        if path in self.ctx:
+            self._drop_memo()
+        self.ctx[path] = out
+        # Link the (still-empty) dict into its parent's resolved container so
+        # root-based lookups see children as soon as they are resolved, without
+        # re-walking the parent chain per leaf.
+        if path:
+            parent_path, _, last_key = path.rpartition(".")
+            parent = self.ctx.get(parent_path)
+            if isinstance(parent, dict):
+                parent[last_key] = out
+
+    def _resolve_containers(self, items: Any, out: Any, path: str) -> None:
+        """Walk nested dicts/lists with an explicit stack instead of recursion.
+
+        Resolution stays strictly in document order (later values may
+        reference earlier siblings); only the plain-container descent is
+        iterative, tagged leaves still go through ``resolve`` dispatch.
+        """
+        stack: list[tuple[Any, Any, str, Any, Any]] = [(items, out, path, None, None)]
+        while stack:
+            it, cur, cur_path, parent, parent_key = stack[-1]
+            entry: Any = next(it, _MISSING)
+            if entry is _MISSING:
+                stack.pop()
+                # Re-assign on completion: an element dict's eager parent link
+                # may have clobbered this slot while the container was open.
+                if type(parent) is dict:
+                    parent[parent_key] = cur
+                    self.ctx[cur_path] = cur
+                continue
+            if type(cur) is dict:
+                key, val = entry
+                child = f"{cur_path}.{key}" if cur_path else key
+                tval = type(val)
+                if tval in _ATOMIC:
+                    cur[key] = val
+                    self.ctx[child] = val
+                elif tval is dict:
+                    child_out: dict[str, Any] = {}
+                    self._enter_dict(child_out, child)
+                    cur[key] = child_out
+                    stack.append((iter(val.items()), child_out, child, cur, key))
+                elif tval is list:
+                    child_list: list[Any] = []
+                    cur[key] = child_list
+                    self.ctx[child] = child_list
+                    stack.append((iter(val), child_list, child, cur, key))
+                else:
+                    resolved_val = self.resolve(val, child)
+                    # Special handling for _ wildcard with IncludeFromSpec
+                    if (
+                        key == "_"
+                        and isinstance(val, IncludeFromSpec)
+                        and isinstance(resolved_val, dict)
+                    ):
+                        # Merge the resolved content directly into cur instead
+                        # of setting cur[key]
+                        cur.update(resolved_val)
+                        for merged_key, merged_val in resolved_val.items():
+                            merged_child = (
+                                f"{cur_path}.{merged_key}" if cur_path else merged_key
+                            )
+                            self.ctx[merged_child] = merged_val
+                    else:
+                        cur[key] = resolved_val
+                        self.ctx[child] = resolved_val
+            else:
+                val = entry
+                tval = type(val)
+                if tval in _ATOMIC:
+                    cur.append(val)
+                elif tval is dict:
+                    elem_out: dict[str, Any] = {}
+                    self._enter_dict(elem_out, cur_path)
+                    cur.append(elem_out)
+                    stack.append((iter(val.items()), elem_out, cur_path, cur, None))
+                elif tval is list:
+                    elem_list: list[Any] = []
+                    cur.append(elem_list)
+                    stack.append((iter(val), elem_list, cur_path, cur, None))
+                else:
+                    cur.append(self.resolve(val, cur_path))
 
     @resolve.register
     def _(self, node: str, path: str = "") -> Any:
+        if "${" not in node:
+            return node
+        if self._memo_enabled:
+            cached = self._memo.get(node, _MISSING)
+            if cached is not _MISSING:
+                return cached
         if m := self.VAR_RE.fullmatch(node):
             expression = m.group(1)
             if is_expression(expression):
                 self.security_policy.check_expression(expression)
-            return (
-                self._expression_evaluator.evaluate(expression)
-                if is_expression(expression)
-                else self._get(expression)
+                result = self._expression_evaluator.evaluate(expression)
+            else:
+                result = self._get(expression)
+        else:
+            result = self.VAR_RE.sub(
+                lambda m: self._resolve_var_to_string(m.group(1)), node
             )
-        return self.VAR_RE.sub(lambda m: self._resolve_var_to_string(m.group(1)), node)
+        if self._memo_enabled:
+            self._memo[node] = result
+        return result
 
     def _resolve_var_to_string(self, expression: str) -> str:
         result = (
@@ -151,13 +277,14 @@ class Resolver:
 
     def _get(self, path: str) -> Any:
         # First, try to find the exact path in context
-        if path in self.ctx:
-            return self.ctx[path]
-        
+        val = self.ctx.get(path, _MISSING)
+        if val is not _MISSING:
+            return val
+
         # Fallback to traversing from root
-        parts = path.split(".")
-        obj = self.ctx.get(parts[0])
-        if obj is None:
+        parts = _split_path(path)
+        obj = self.ctx.get(parts[0], _MISSING)
+        if obj is _MISSING or obj is None:
             raise ResolutionError(f"Unknown variable '{parts[0]}'")
 
         for part in parts[1:]:
@@ -185,9 +312,7 @@ class Resolver:
         return path.startswith("$") and "." not in path
     
     def _is_method_call(self, path: str) -> bool:
-        return (path.startswith("$") and 
-                "." in path and 
-                not re.search(r"\$", path[1:]))
+        return path.startswith("$") and "." in path and "$" not in path[1:]
     
     def _resolve_single_variable(self, path: str) -> Any:
         var_value = self._get(path[1:])
@@ -203,16 +328,16 @@ class Resolver:
         return getattr(obj, method_name)
     
     def _resolve_variable_interpolation(self, path_template: str) -> Any:
-        interpolated_path = re.sub(
-            r"\$([a-zA-Z_][a-zA-Z0-9_]*)",
-            lambda m: str(self._get(m.group(1))),
-            path_template,
+        interpolated_path = "".join(
+            str(self._get(text)) if is_var else text
+            for is_var, text in _tokenize_path_template(path_template)
         )
         if self.security_policy:
             self.security_policy.check_import(interpolated_path)
         return _import_attr(interpolated_path)
 
 
+@lru_cache(maxsize=1024)
 def _import_attr(path: str):
     module, _, name = path.rpartition(".")
     mod = importlib.import_module(module or "builtins")
@@ -1,4 +1,22 @@
 import fnmatch
+import os
+import re
+
+_WILDCARD_CHARS = frozenset("*?[")
+
+
+def _compile_pattern(pattern):
+    """Build a matcher for one allowlist pattern.
+
+    Prefix-style patterns like 'collections.*' compile to a plain
+    str.startswith check, which costs O(prefix length) per probe; anything
+    with other wildcards falls back to the translated fnmatch regex.
+    """
+    normalized = os.path.normcase(pattern)
+    head, star, tail = normalized.partition("*")
+    if star and not tail and not (_WILDCARD_CHARS & set(head)):
+        return lambda check, _prefix=head: check.startswith(_prefix)
+    return re.compile(fnmatch.translate(normalized)).match
 
 
 class SecurityPolicy:
@@ -48,6 +66,7 @@ class SecurityPolicy:
         self.allowed_include_paths = (
             set() if allowed_include_paths is None else set(allowed_include_paths)
         )
+        self._compiled_patterns: dict[str, object] = {}
 
         if restrictive:
             self.allow_expressions = (
@@ -100,8 +119,16 @@ class SecurityPolicy:
 
     def _matches_patterns(self, check, patterns):
         """Check if path matches any of the allowed patterns (supports wildcards)."""
+        # Exact entries (no wildcards) are the common case; one set probe
+        # short-circuits the per-pattern matching loop.
+        if check in patterns:
+            return True
+        check = os.path.normcase(check)
         for pattern in patterns:
-            if fnmatch.fnmatch(check, pattern):
+            matcher = self._compiled_patterns.get(pattern)
+            if matcher is None:
+                matcher = self._compiled_patterns[pattern] = _compile_pattern(pattern)
+            if matcher(check):
                 return True
         return False
 
@@ -1,6 +1,6 @@
-from pathlib import Path
-from typing import IO, Any, Sequence, Union
 import os
+from io import StringIO
+from typing import IO, Any, Sequence, Union
 
 from pyamlo.merge import deep_merge
 from pyamlo.include import process_includes, set_base_paths
@@ -9,7 +9,7 @@ from pyamlo.security import SecurityPolicy
 
 
 def _load_source(
-    source: Union[str, Path, IO[str]], security_policy: SecurityPolicy
+    source: Union[str, os.PathLike, IO[str]], security_policy: SecurityPolicy
 ) -> dict[str, Any]:
     def _load_with_loader(stream):
         loader = ConfigLoader(stream, security_policy=security_policy)
@@ -17,14 +17,19 @@ def _load_source(
             return loader.get_single_data()
         finally:
             loader.dispose()
-    if isinstance(source, (str, Path)):
+    if isinstance(source, (str, os.PathLike)):
+        # One read hands the whole document to the scanner at once instead of
+        # PyYAML pulling the stream in small chunks; the named StringIO keeps
+        # the file path in YAML error marks.
         with open(source, "r") as f:
-            return _load_with_loader(f)
+            stream = StringIO(f.read())
+        stream.name = os.fspath(source)
+        return _load_with_loader(stream)
     return _load_with_loader(source)
 
 
 def _process_single_source(
-    src: Union[str, Path, IO[str], dict], security_policy: SecurityPolicy
+    src: Union[str, os.PathLike, IO[str], dict], security_policy: SecurityPolicy
 ) -> dict[str, Any]:
     if isinstance(src, dict):
         # Dict sources contain already resolved Python objects, use as-is
@@ -32,7 +37,10 @@ def _process_single_source(
         src_path = "<dict>"
     else:
         raw = _load_source(src, security_policy=security_policy)
-        src_path = src.name if isinstance(src, IO) else str(src)
+        if isinstance(src, (str, os.PathLike)):
+            src_path = os.fspath(src)
+        else:
+            src_path = src.name if isinstance(src, IO) else str(src)
     if not raw:
         return {}
     if src_path and src_path != "<dict>":
@@ -41,15 +49,22 @@ def _process_single_source(
 
 
 def get_sources(
-    source: Union[str, Path, IO[str], dict, Sequence[Union[str, Path, IO[str], dict]]],
-) -> list[Union[str, Path, IO[str], dict]]:
-    if not isinstance(source, Sequence) or isinstance(source, (str, Path)):
+    source: Union[
+        str,
+        os.PathLike,
+        IO[str],
+        dict,
+        Sequence[Union[str, os.PathLike, IO[str], dict]],
+    ],
+) -> list[Union[str, os.PathLike, IO[str], dict]]:
+    if not isinstance(source, Sequence) or isinstance(source, (str, os.PathLike)):
         return [source]
     return list(source)
 
 
 def merge_all_sources(
-    sources: list[Union[str, Path, IO[str], dict]], security_policy: SecurityPolicy
+    sources: list[Union[str, os.PathLike, IO[str], dict]],
+    security_policy: SecurityPolicy,
 ) -> dict[str, Any]:
     config: dict[str, Any] = {}
     for src in sources:
@@ -1,8 +1,14 @@
 import os
+import sys
 from collections import UserDict, UserList
-from typing import Any, Hashable, Optional, Union
+from typing import Any, Hashable, Optional, Sequence, Union, cast
 
-from yaml import MappingNode, SafeLoader, ScalarNode, SequenceNode
+from yaml import MappingNode, ScalarNode, SequenceNode
+
+try:
+    from yaml import CSafeLoader as _BaseLoader
+except ImportError:
+    from yaml import SafeLoader as _BaseLoader  # type: ignore[assignment]
 
 from pyamlo.security import SecurityPolicy
 
@@ -28,15 +34,17 @@ class PatchSpec(UserDict):
 
 
 class CallSpec:
+    __slots__ = ("path", "args", "kwargs", "is_interpolated")
+
     def __init__(
         self,
         path: str,
-        args: list[Any],
+        args: Sequence[Any],
         kwargs: dict[str, Any],
         is_interpolated: bool = False,
     ) -> None:
-        self.path: str = path
-        self.args: list[Any] = args
+        self.path: str = sys.intern(path)
+        self.args: Sequence[Any] = args
         self.kwargs: dict[str, Any] = kwargs
         self.is_interpolated: bool = is_interpolated
 
@@ -64,14 +72,19 @@ class IncludeFromSpec:
         self._base_path = base_path
 
 
-class ConfigLoader(SafeLoader):
+class ConfigLoader(_BaseLoader):
+    # Set by construct_env; trees that read the environment at parse time
+    # must not be reused from the include parse cache.
+    _used_env: bool = False
+
     def __init__(self, stream, security_policy=SecurityPolicy(restrictive=False)):
         super().__init__(stream)
         self.security_policy = security_policy
 
 
 def construct_env(loader: ConfigLoader, node: Union[ScalarNode, MappingNode]) -> Any:
-
+    loader._used_env = True
+    var: Any
     if isinstance(node, ScalarNode):
         var = loader.construct_scalar(node)
         loader.security_policy.check_env_var(var)
@@ -109,18 +122,24 @@ def construct_patch(loader: ConfigLoader, node: MappingNode) -> PatchSpec:
     return PatchSpec(loader.construct_mapping(node, deep=True))
 
 
+# Shared empty args for the common bare '!@Target' case; args are never
+# mutated after construction, unlike kwargs which override layers merge into.
+_EMPTY_ARGS: tuple[Any, ...] = ()
+
+
 def _construct_callspec_args(
     loader: ConfigLoader, node: Union[MappingNode, SequenceNode, ScalarNode]
-) -> tuple[list[Any], dict[str, Any]]:
+) -> tuple[Sequence[Any], dict[str, Any]]:
     """Extract args and kwargs from a node."""
     if isinstance(node, MappingNode):
-        return [], loader.construct_mapping(node, deep=True)
+        return _EMPTY_ARGS, cast(
+            dict[str, Any], loader.construct_mapping(node, deep=True)
+        )
     elif isinstance(node, SequenceNode):
         return loader.construct_sequence(node, deep=True), {}
     elif isinstance(node, ScalarNode):
         scalar = loader.construct_scalar(node)
-        args = [] if scalar in (None, "") else [scalar]
-        return args, {}
+        return ([scalar] if scalar else _EMPTY_ARGS), {}
     raise TagError(f"Unsupported node type at {node.start_mark}")
 
 
@@ -1,10 +1,12 @@
+import os
+
 import pytest
 from pathlib import Path
 from yaml import MappingNode, ScalarNode
 from yaml.constructor import ConstructorError
 
 from pyamlo import load_config
-from pyamlo.include import IncludeError, load_raw, _load_include
+from pyamlo.include import IncludeError, _parse_cache, load_raw, _load_include
 from pyamlo.tags import ConfigLoader, construct_include
 
 
@@ -58,3 +60,78 @@ def test_construct_include_error():
         ConstructorError, match="expected a scalar node, but found mapping"
     ):
         construct_include(loader, node)
+
+
+def test_parse_cache_invalidated_on_file_change(tmp_path):
+    inc = tmp_path / "inc.yaml"
+    main = tmp_path / "main.yaml"
+    inc.write_text("value: first")
+    main.write_text("include!:\n  - inc.yaml\n")
+
+    assert load_config(str(main))["value"] == "first"
+
+    os.utime(inc, ns=(0, os.stat(inc).st_mtime_ns + 1_000_000))
+    inc.write_text("value: second")
+    assert load_config(str(main))["value"] == "second"
+
+
+def test_parse_cache_keeps_one_entry_per_file(tmp_path):
+    inc = tmp_path / "inc.yaml"
+    main = tmp_path / "main.yaml"
+    main.write_text("include!:\n  - inc.yaml\n")
+    key = os.path.realpath(str(inc))
+
+    for i in range(3):
+        inc.write_text(f"value: {i}")
+        os.utime(inc, ns=(0, os.stat(inc).st_mtime_ns + 1_000_000 * (i + 1)))
+        load_config(str(main))
+
+    assert sum(1 for cached in _parse_cache if cached == key) == 1
+
+
+def test_parse_cache_excludes_env_tags(tmp_path, monkeypatch):
+    inc = tmp_path / "inc.yaml"
+    main = tmp_path / "main.yaml"
+    inc.write_text("secret: !env PYAMLO_CACHE_TEST")
+    main.write_text("include!:\n  - inc.yaml\n")
+
+    monkeypatch.setenv("PYAMLO_CACHE_TEST", "one")
+    assert load_config(str(main))["secret"] == "one"
+    monkeypatch.setenv("PYAMLO_CACHE_TEST", "two")
+    assert load_config(str(main))["secret"] == "two"
+
+
+def test_parse_cache_returns_isolated_trees(tmp_path):
+    inc = tmp_path / "inc.yaml"
+    main = tmp_path / "main.yaml"
+    inc.write_text("svc:\n  vals: [1, {k: v}]\n")
+    main.write_text("include!:\n  - inc.yaml\n")
+
+    first = load_config(str(main))
+    first["svc"]["vals"][1]["k"] = "mutated"
+    second = load_config(str(main))
+    assert second["svc"]["vals"][1] == {"k": "v"}
+
+
+def test_include_under_key_with_later_sibling(tmp_path):
+    inc = tmp_path / "inc.yaml"
+    inc.write_text("svc:\n  name: base\n")
+    main = tmp_path / "main.yaml"
+    main.write_text("first: !include inc.yaml\nlater:\n  port: 8080\n")
+
+    config = load_config(str(main))
+    assert config["first"] == {"svc": {"name": "base"}}
+    assert config["later"] == {"port": 8080}
+
+
+def test_nested_include_with_later_sibling(tmp_path):
+    inc = tmp_path / "inc.yaml"
+    inc.write_text("svc:\n  name: base\n")
+    main = tmp_path / "main.yaml"
+    main.write_text(
+        "outer:\n  first: !include inc.yaml\nlater:\n  port: 8080\n"
+    )
+
+    config = load_config(str(main))
+    assert config["outer"] == {"first": {"svc": {"name": "base"}}}
+    assert config["later"] == {"port": 8080}
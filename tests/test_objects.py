@@ -46,14 +46,14 @@ def test_callspec_empty_scalar():
     loader = ConfigLoader("")
     node = ScalarNode("!@test", "")
     spec = construct_callspec(loader, "test", node)
-    assert spec.args == []
+    assert spec.args == ()
 
 
 def test_callspec_none_scalar():
     loader = ConfigLoader("")
     node = ScalarNode("!@test", None)
     spec = construct_callspec(loader, "test", node)
-    assert spec.args == []
+    assert spec.args == ()
 
 
 def test_import_tag():